@@ -6,7 +6,7 @@ This script helps you set up and run the WRICEF data visualization tools
 
 import sys
 import subprocess
-import importlib
+from importlib.metadata import distributions
 import os
 
 def check_python_version():
@@ -18,10 +18,10 @@ def check_python_version():
     print(f"✅ Python version: {sys.version.split()[0]} (Compatible)")
     return True
 
-def install_package(package):
-    """Install a Python package using pip"""
+def install_packages(packages):
+    """Install Python packages using a single pip invocation"""
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
         return True
     except subprocess.CalledProcessError:
         return False
@@ -34,35 +34,37 @@ def check_and_install_packages():
         'matplotlib': 'matplotlib>=3.5.0',
         'seaborn': 'seaborn>=0.11.0',
         'plotly': 'plotly>=5.0.0',
-        'streamlit': 'streamlit>=1.25.0',
-        'openpyxl': 'openpyxl>=3.0.9'
+        'streamlit': 'streamlit>=1.37.0',
+        'openpyxl': 'openpyxl>=3.0.9',
+        'pyarrow': 'pyarrow>=10.0.0'
     }
     
     print("\n🔧 Checking required packages...")
     missing_packages = []
     
+    # Read installed distribution metadata instead of importing each package
+    installed = {(dist.metadata['Name'] or '').lower() for dist in distributions()}
+    
     for package, version in required_packages.items():
-        try:
-            importlib.import_module(package)
+        if package.lower() in installed:
             print(f"✅ {package} - Already installed")
-        except ImportError:
+        else:
             print(f"❌ {package} - Not found")
             missing_packages.append(version)
     
     if missing_packages:
         print(f"\n📦 Installing {len(missing_packages)} missing packages...")
-        for package in missing_packages:
-            print(f"Installing {package}...")
-            if install_package(package):
-                print(f"✅ {package} installed successfully")
-            else:
-                print(f"❌ Failed to install {package}")
-                return False
+        print(f"Installing {', '.join(missing_packages)}...")
+        if install_packages(missing_packages):
+            print("✅ Missing packages installed successfully")
+        else:
+            print("❌ Failed to install missing packages")
+            return False
     
     print("✅ All required packages are installed!")
     return True
 
-def create_sample_files():
+def create_sample_files(entries):
     """Create sample configuration files if they don't exist"""
     files_to_create = {
         'config.py': '''# Configuration file for WRICEF Data Visualization
@@ -107,14 +109,14 @@ pause
     
     print("\n📁 Creating configuration files...")
     for filename, content in files_to_create.items():
-        if not os.path.exists(filename):
+        if filename not in entries:
             with open(filename, 'w') as f:
                 f.write(content)
             print(f"✅ Created {filename}")
         else:
             print(f"ℹ️  {filename} already exists")
 
-def check_files():
+def check_files(entries):
     """Check if required Python files exist"""
     required_files = [
         'wricef_visualizer.py',
@@ -127,7 +129,7 @@ def check_files():
     missing_files = []
     
     for file in required_files:
-        if os.path.exists(file):
+        if file in entries:
             print(f"✅ {file} - Found")
         else:
             print(f"❌ {file} - Missing")
@@ -140,10 +142,10 @@ def check_files():
     
     return True
 
-def create_output_directory():
+def create_output_directory(entries):
     """Create output directory for generated files"""
     output_dir = "output"
-    if not os.path.exists(output_dir):
+    if output_dir not in entries:
         os.makedirs(output_dir)
         print(f"✅ Created {output_dir} directory")
     else:
@@ -213,8 +215,11 @@ def main():
     if not check_python_version():
         return False
     
+    # List the current directory once instead of probing each path
+    entries = {entry.name for entry in os.scandir('.')}
+    
     # Check required files
-    if not check_files():
+    if not check_files(entries):
         return False
     
     # Install required packages
@@ -222,8 +227,8 @@ def main():
         return False
     
     # Create additional files
-    create_sample_files()
-    create_output_directory()
+    create_sample_files(entries)
+    create_output_directory(entries)
     
     # Display usage instructions
     display_usage_instructions()
@@ -235,7 +240,8 @@ def main():
     if response in ['y', 'yes']:
         print("\n🚀 Running Quick Start Example...")
         try:
-            import quick_start_example
+            # Run in a separate interpreter so the demo's imports and failures stay out of setup
+            subprocess.check_call([sys.executable, "quick_start_example.py"])
         except Exception as e:
             print(f"❌ Error running quick start: {e}")
             print("You can run it manually: python quick_start_example.py")
@@ -4,14 +4,6 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from datetime import datetime
-import io
-import base64
 
 # Configure page
 st.set_page_config(
@@ -48,15 +40,213 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Low-cardinality string columns stored as pandas categoricals
+CAT_COLS = ['Implementation', 'WRICEF Type', 'Complexity', 'Priority of Delivery',
+            'Stage', 'Process Area', 'Functional Owner', 'Dev Lead']
+
+# High-cardinality string columns stored as Arrow-backed strings
+STRING_COLS = ['Project Name']
+
+# Effort columns stored as float32
+FLOAT_COLS = ['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)',
+              'PI Effort Forecast (hrs)', 'PI Actual Effort (hrs)']
+
+@st.cache_data
+def _build_sample_df(n_records: int = 500) -> pd.DataFrame:
+    """Build the deterministic sample dataset (cached across reruns)"""
+    rng = np.random.default_rng(42)
+
+    implementations = ['Catalyst', 'Goldilocks (ANZ)', 'EWM', 'Supernova']
+    wricef_types = ['W', 'R', 'I', 'C', 'E', 'F']
+    complexities = ['Low', 'Medium', 'High', 'Very High']
+    priorities = ['1 - High', '2 - Medium', '3 - Low']
+    stages = ['06 - Dev Completed', '04 - Dev in progress', '16 - FS Review in Progress', 
+             '13 - Deferred', '15 - No Development Required']
+    process_areas = ['STS', 'RTR', 'MDM', 'PTM', 'PTP', 'LEX', 'OTC', 'EWM']
+
+    # Generate realistic dates
+    start_date = pd.Timestamp('2022-01-01')
+    end_date = pd.Timestamp('2024-12-31')
+    dates = pd.date_range(start_date, end_date)
+
+    owners = [f"Owner {i}" for i in range(1, 20)]
+    leads = [f"Lead {i}" for i in range(1, 15)]
+
+    def sample_categorical(categories):
+        # Sample integer codes directly instead of materialising Python strings
+        codes = rng.integers(0, len(categories), n_records, dtype=np.int8)
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    return pd.DataFrame({
+        'Implementation': sample_categorical(implementations),
+        'Project Name': "Project " + pd.RangeIndex(1, n_records + 1).astype(str),
+        'WRICEF Type': sample_categorical(wricef_types),
+        'Complexity': sample_categorical(complexities),
+        'Priority of Delivery': sample_categorical(priorities),
+        'Stage': sample_categorical(stages),
+        'Process Area': sample_categorical(process_areas),
+        'ABAP Effort Forecast (hrs)': rng.uniform(10, 200, n_records).round(1),
+        'ABAP Actual Effort (hrs)': rng.uniform(10, 200, n_records).round(1),
+        'PI Effort Forecast (hrs)': rng.uniform(5, 100, n_records).round(1),
+        'PI Actual Effort (hrs)': rng.uniform(5, 100, n_records).round(1),
+        'FSD Planned Del Date': dates[rng.integers(0, len(dates), n_records)],
+        'Dev Actual Delivery Date': dates[rng.integers(0, len(dates), n_records)],
+        'Functional Owner': sample_categorical(owners),
+        'Dev Lead': sample_categorical(leads)
+    })
+
+# Streamlit caches are shared across sessions, so bound how many entries each keeps
+_CACHE_ENTRIES = 32
+# Parsed uploads are the largest entries, so also expire them after an hour
+_WORKBOOK_TTL = 3600
+
+# The cached helpers below are keyed on a small data_key (data source id plus the
+# active filter selections). The frame itself is passed as `_df`, which Streamlit
+# does not hash, so a cache hit costs a tuple lookup rather than a pass over the data.
+
+@st.cache_data(max_entries=_CACHE_ENTRIES, ttl=_WORKBOOK_TTL)
+def _read_workbook(file_id: str, _uploaded_file) -> pd.DataFrame:
+    """Parse an uploaded workbook once per upload (keyed on its file id)"""
+    engine = 'openpyxl' if _uploaded_file.name.lower().endswith('.xlsx') else None
+    return pd.read_excel(_uploaded_file, engine=engine)
+
+@st.cache_data(max_entries=_CACHE_ENTRIES)
+def _vc(data_key: tuple, _df: pd.DataFrame, col: str) -> pd.Series:
+    """Value counts for a column (cached per data key)"""
+    counts = _df[col].value_counts()
+    # Categorical columns report unobserved categories with a zero count
+    return counts[counts > 0]
+
+@st.cache_data(max_entries=_CACHE_ENTRIES)
+def _effort_by_impl(data_key: tuple, _df: pd.DataFrame) -> pd.DataFrame:
+    """Total ABAP forecast/actual effort per implementation (cached per data key)"""
+    return _df.groupby('Implementation', observed=True)[['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)']].sum().reset_index()
+
+@st.cache_data(max_entries=_CACHE_ENTRIES)
+def _filter_options(data_key: tuple, _df: pd.DataFrame) -> dict:
+    """Sidebar filter choices and the FSD date bounds (cached per data key)"""
+    options = {
+        col: ['All'] + sorted(_df[col].dropna().unique().tolist(), key=str)
+        for col in ['Implementation', 'WRICEF Type', 'Complexity', 'Priority of Delivery']
+    }
+    options['date_min'] = _df['FSD Planned Del Date'].min().date()
+    options['date_max'] = _df['FSD Planned Del Date'].max().date()
+    return options
+
+@st.cache_data(max_entries=_CACHE_ENTRIES)
+def _corr_matrix(data_key: tuple, _df: pd.DataFrame) -> pd.DataFrame:
+    """Pairwise correlation of the numeric columns (cached per data key)"""
+    return _df.select_dtypes(include=[np.number]).corr()
+
+@st.cache_data(max_entries=_CACHE_ENTRIES)
+def _monthly_deliveries(data_key: tuple, _df: pd.DataFrame) -> pd.DataFrame:
+    """Deliveries per planned FSD month (cached per data key)"""
+    months = _df['FSD Planned Del Date'].to_numpy(dtype='datetime64[M]')
+    months = months[~np.isnat(months)]
+    uniq, counts = np.unique(months, return_counts=True)
+    return pd.DataFrame({'FSD Planned Del Date': uniq.astype(str), 'Number of Deliveries': counts})
+
+@st.cache_resource(max_entries=_CACHE_ENTRIES)
+def _effort_scatter_fig(data_key: tuple, _df: pd.DataFrame):
+    """ABAP forecast vs actual scatter (cached per data key)"""
+    import plotly.express as px
+
+    fig = px.scatter(
+        _df,
+        x='ABAP Effort Forecast (hrs)',
+        y='ABAP Actual Effort (hrs)',
+        color='Implementation',
+        size='ABAP Effort Forecast (hrs)',
+        hover_data=['WRICEF Type', 'Complexity'],
+        title="ABAP: Forecast vs Actual Effort"
+    )
+    # Add perfect estimation line
+    max_effort = max(_df['ABAP Effort Forecast (hrs)'].max(), _df['ABAP Actual Effort (hrs)'].max())
+    fig.add_shape(
+        type="line",
+        x0=0, y0=0, x1=max_effort, y1=max_effort,
+        line=dict(color="red", width=2, dash="dash"),
+    )
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_resource(max_entries=_CACHE_ENTRIES)
+def _timeline_scatter_fig(data_key: tuple, _df: pd.DataFrame):
+    """Project timeline scatter sized by effort (cached per data key)"""
+    import plotly.express as px
+
+    fig = px.scatter(
+        _df,
+        x='FSD Planned Del Date',
+        y='Implementation',
+        color='WRICEF Type',
+        size='ABAP Effort Forecast (hrs)',
+        hover_data=['Complexity', 'Priority of Delivery', 'Stage', 'Project Name'],
+        title="Project Timeline with Effort Sizing"
+    )
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_resource(max_entries=_CACHE_ENTRIES)
+def _sunburst_fig(data_key: tuple, _df: pd.DataFrame):
+    """Implementation → WRICEF → Complexity sunburst (cached per data key)"""
+    import plotly.express as px
+
+    fig = px.sunburst(
+        _df,
+        path=['Implementation', 'WRICEF Type', 'Complexity'],
+        title="Hierarchical View: Implementation → WRICEF → Complexity"
+    )
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_resource(max_entries=_CACHE_ENTRIES)
+def _treemap_fig(data_key: tuple, _df: pd.DataFrame):
+    """Implementation → WRICEF treemap (cached per data key)"""
+    import plotly.express as px
+
+    fig = px.treemap(
+        _df,
+        path=['Implementation', 'WRICEF Type'],
+        title="WRICEF Distribution Treemap"
+    )
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_resource(max_entries=_CACHE_ENTRIES)
+def _effort_3d_fig(data_key: tuple, _df: pd.DataFrame):
+    """3D ABAP vs PI effort scatter (cached per data key)"""
+    import plotly.express as px
+
+    fig = px.scatter_3d(
+        _df,
+        x='ABAP Effort Forecast (hrs)',
+        y='ABAP Actual Effort (hrs)',
+        z='PI Effort Forecast (hrs)',
+        color='Implementation',
+        symbol='WRICEF Type',
+        size='ABAP Effort Forecast (hrs)',
+        hover_data=['Complexity', 'Priority of Delivery'],
+        title="3D Effort Analysis: ABAP vs PI Effort"
+    )
+    fig.update_layout(height=600)
+    return fig
+
 class StreamlitWRICEFDashboard:
     def __init__(self):
         self.df = None
+        self._fsd_d = None
+        # Cheap cache key identifying the data source and active filters
+        self.data_key = None
         
     def load_data(self, uploaded_file=None):
         """Load data from uploaded file or create sample data"""
         if uploaded_file is not None:
             try:
-                self.df = pd.read_excel(uploaded_file)
+                self.df = _read_workbook(uploaded_file.file_id, uploaded_file)
+                self.data_key = (uploaded_file.file_id,)
+                self.optimize_dtypes()
+                self._fsd_d = self.df['FSD Planned Del Date'].to_numpy(dtype='datetime64[D]')
                 st.success(f"✅ Data loaded successfully! Shape: {self.df.shape}")
                 return True
             except Exception as e:
@@ -65,44 +255,31 @@ class StreamlitWRICEFDashboard:
         else:
             # Create sample data
             self.create_sample_data()
+            self.data_key = ('sample',)
+            self.optimize_dtypes()
+            self._fsd_d = self.df['FSD Planned Del Date'].to_numpy(dtype='datetime64[D]')
             st.info("📝 Using sample data for demonstration")
             return True
     
+    def optimize_dtypes(self):
+        """Store repeated strings as categories, unique strings in Arrow and effort columns as float32"""
+        for col in CAT_COLS:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
+        
+        for col in STRING_COLS:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('string[pyarrow]')
+        
+        for col in FLOAT_COLS:
+            if col in self.df.columns:
+                self.df[col] = pd.to_numeric(self.df[col], errors='coerce').astype('float32')
+    
     def create_sample_data(self):
         """Create sample data for demonstration"""
-        np.random.seed(42)
-        n_records = 500
-        
-        implementations = ['Catalyst', 'Goldilocks (ANZ)', 'EWM', 'Supernova']
-        wricef_types = ['W', 'R', 'I', 'C', 'E', 'F']
-        complexities = ['Low', 'Medium', 'High', 'Very High']
-        priorities = ['1 - High', '2 - Medium', '3 - Low']
-        stages = ['06 - Dev Completed', '04 - Dev in progress', '16 - FS Review in Progress', 
-                 '13 - Deferred', '15 - No Development Required']
-        process_areas = ['STS', 'RTR', 'MDM', 'PTM', 'PTP', 'LEX', 'OTC', 'EWM']
-        
-        # Generate realistic dates
-        start_date = pd.Timestamp('2022-01-01')
-        end_date = pd.Timestamp('2024-12-31')
-        
-        self.df = pd.DataFrame({
-            'Implementation': np.random.choice(implementations, n_records),
-            'Project Name': [f"Project {i+1}" for i in range(n_records)],
-            'WRICEF Type': np.random.choice(wricef_types, n_records),
-            'Complexity': np.random.choice(complexities, n_records),
-            'Priority of Delivery': np.random.choice(priorities, n_records),
-            'Stage': np.random.choice(stages, n_records),
-            'Process Area': np.random.choice(process_areas, n_records),
-            'ABAP Effort Forecast (hrs)': np.random.uniform(10, 200, n_records).round(1),
-            'ABAP Actual Effort (hrs)': np.random.uniform(10, 200, n_records).round(1),
-            'PI Effort Forecast (hrs)': np.random.uniform(5, 100, n_records).round(1),
-            'PI Actual Effort (hrs)': np.random.uniform(5, 100, n_records).round(1),
-            'FSD Planned Del Date': pd.to_datetime(np.random.choice(pd.date_range(start_date, end_date), n_records)),
-            'Dev Actual Delivery Date': pd.to_datetime(np.random.choice(pd.date_range(start_date, end_date), n_records)),
-            'Functional Owner': [f"Owner {np.random.randint(1, 20)}" for _ in range(n_records)],
-            'Dev Lead': [f"Lead {np.random.randint(1, 15)}" for _ in range(n_records)]
-        })
+        self.df = _build_sample_df()
     
+    @st.fragment
     def data_overview(self):
         """Display data overview"""
         st.header("📋 Data Overview")
@@ -134,7 +311,8 @@ class StreamlitWRICEFDashboard:
             """.format(self.df['WRICEF Type'].nunique()), unsafe_allow_html=True)
         
         with col4:
-            total_effort = self.df['ABAP Effort Forecast (hrs)'].sum()
+            # Accumulate in float64; float32 sums drift on large uploads
+            total_effort = self.df['ABAP Effort Forecast (hrs)'].astype(np.float64).sum()
             st.markdown("""
             <div class="metric-card">
                 <h3>Total Effort (hrs)</h3>
@@ -146,20 +324,24 @@ class StreamlitWRICEFDashboard:
         st.subheader("📊 Data Sample")
         st.dataframe(self.df.head(10), use_container_width=True)
     
+    @st.fragment
     def create_distribution_charts(self):
         """Create distribution charts"""
+        import plotly.express as px
+
         st.header("📈 Distribution Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             # WRICEF Type Distribution
+            wricef_counts = _vc(self.data_key, self.df, 'WRICEF Type')
             fig_wricef = px.bar(
-                x=self.df['WRICEF Type'].value_counts().index,
-                y=self.df['WRICEF Type'].value_counts().values,
+                x=wricef_counts.index,
+                y=wricef_counts.values,
                 title="WRICEF Type Distribution",
                 labels={'x': 'WRICEF Type', 'y': 'Count'},
-                color=self.df['WRICEF Type'].value_counts().values,
+                color=wricef_counts.values,
                 color_continuous_scale='viridis'
             )
             fig_wricef.update_layout(height=400, showlegend=False)
@@ -167,9 +349,10 @@ class StreamlitWRICEFDashboard:
         
         with col2:
             # Implementation Distribution
+            impl_counts = _vc(self.data_key, self.df, 'Implementation')
             fig_impl = px.pie(
-                values=self.df['Implementation'].value_counts().values,
-                names=self.df['Implementation'].value_counts().index,
+                values=impl_counts.values,
+                names=impl_counts.index,
                 title="Implementation Distribution"
             )
             fig_impl.update_layout(height=400)
@@ -177,7 +360,7 @@ class StreamlitWRICEFDashboard:
         
         # Complexity Distribution
         st.subheader("🎯 Complexity Analysis")
-        complexity_counts = self.df['Complexity'].value_counts()
+        complexity_counts = _vc(self.data_key, self.df, 'Complexity')
         fig_complexity = px.bar(
             x=complexity_counts.index,
             y=complexity_counts.values,
@@ -188,36 +371,23 @@ class StreamlitWRICEFDashboard:
         fig_complexity.update_layout(height=400)
         st.plotly_chart(fig_complexity, use_container_width=True)
     
+    @st.fragment
     def create_effort_analysis(self):
         """Create effort analysis charts"""
+        import plotly.express as px
+
         st.header("⚡ Effort Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             # ABAP Effort: Forecast vs Actual
-            fig_effort = px.scatter(
-                self.df,
-                x='ABAP Effort Forecast (hrs)',
-                y='ABAP Actual Effort (hrs)',
-                color='Implementation',
-                size='ABAP Effort Forecast (hrs)',
-                hover_data=['WRICEF Type', 'Complexity'],
-                title="ABAP: Forecast vs Actual Effort"
-            )
-            # Add perfect estimation line
-            max_effort = max(self.df['ABAP Effort Forecast (hrs)'].max(), self.df['ABAP Actual Effort (hrs)'].max())
-            fig_effort.add_shape(
-                type="line",
-                x0=0, y0=0, x1=max_effort, y1=max_effort,
-                line=dict(color="red", width=2, dash="dash"),
-            )
-            fig_effort.update_layout(height=500)
+            fig_effort = _effort_scatter_fig(self.data_key, self.df)
             st.plotly_chart(fig_effort, use_container_width=True)
         
         with col2:
             # Effort by Implementation
-            effort_by_impl = self.df.groupby('Implementation')[['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)']].sum().reset_index()
+            effort_by_impl = _effort_by_impl(self.data_key, self.df)
             effort_melted = effort_by_impl.melt(id_vars='Implementation', 
                                               value_vars=['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)'],
                                               var_name='Effort Type', value_name='Hours')
@@ -233,38 +403,31 @@ class StreamlitWRICEFDashboard:
             fig_effort_impl.update_layout(height=500)
             st.plotly_chart(fig_effort_impl, use_container_width=True)
     
+    @st.fragment
     def create_timeline_analysis(self):
         """Create timeline analysis"""
+        import plotly.express as px
+
         st.header("📅 Timeline Analysis")
         
         # Monthly trend
-        monthly_data = self.df.groupby(self.df['FSD Planned Del Date'].dt.to_period('M')).size().reset_index()
-        monthly_data['FSD Planned Del Date'] = monthly_data['FSD Planned Del Date'].astype(str)
+        monthly_data = _monthly_deliveries(self.data_key, self.df)
         
         fig_timeline = px.line(
             monthly_data,
             x='FSD Planned Del Date',
-            y=0,
-            title="Monthly Delivery Trend",
-            labels={0: 'Number of Deliveries'}
+            y='Number of Deliveries',
+            title="Monthly Delivery Trend"
         )
         fig_timeline.update_layout(height=400)
         st.plotly_chart(fig_timeline, use_container_width=True)
         
         # Interactive scatter plot
         st.subheader("🎯 Interactive Project Timeline")
-        fig_scatter = px.scatter(
-            self.df,
-            x='FSD Planned Del Date',
-            y='Implementation',
-            color='WRICEF Type',
-            size='ABAP Effort Forecast (hrs)',
-            hover_data=['Complexity', 'Priority of Delivery', 'Stage', 'Project Name'],
-            title="Project Timeline with Effort Sizing"
-        )
-        fig_scatter.update_layout(height=500)
+        fig_scatter = _timeline_scatter_fig(self.data_key, self.df)
         st.plotly_chart(fig_scatter, use_container_width=True)
     
+    @st.fragment
     def create_advanced_visualizations(self):
         """Create advanced visualizations"""
         st.header("🚀 Advanced Analytics")
@@ -273,47 +436,28 @@ class StreamlitWRICEFDashboard:
         
         with col1:
             # Sunburst Chart
-            fig_sunburst = px.sunburst(
-                self.df,
-                path=['Implementation', 'WRICEF Type', 'Complexity'],
-                title="Hierarchical View: Implementation → WRICEF → Complexity"
-            )
-            fig_sunburst.update_layout(height=500)
+            fig_sunburst = _sunburst_fig(self.data_key, self.df)
             st.plotly_chart(fig_sunburst, use_container_width=True)
         
         with col2:
             # Treemap
-            fig_treemap = px.treemap(
-                self.df,
-                path=['Implementation', 'WRICEF Type'],
-                title="WRICEF Distribution Treemap"
-            )
-            fig_treemap.update_layout(height=500)
+            fig_treemap = _treemap_fig(self.data_key, self.df)
             st.plotly_chart(fig_treemap, use_container_width=True)
         
         # 3D Scatter Plot
         st.subheader("🌟 3D Effort Analysis")
-        fig_3d = px.scatter_3d(
-            self.df,
-            x='ABAP Effort Forecast (hrs)',
-            y='ABAP Actual Effort (hrs)',
-            z='PI Effort Forecast (hrs)',
-            color='Implementation',
-            symbol='WRICEF Type',
-            size='ABAP Effort Forecast (hrs)',
-            hover_data=['Complexity', 'Priority of Delivery'],
-            title="3D Effort Analysis: ABAP vs PI Effort"
-        )
-        fig_3d.update_layout(height=600)
+        fig_3d = _effort_3d_fig(self.data_key, self.df)
         st.plotly_chart(fig_3d, use_container_width=True)
     
+    @st.fragment
     def create_heatmaps(self):
         """Create correlation heatmaps"""
+        import plotly.express as px
+
         st.header("🌡️ Correlation Analysis")
         
         # Create correlation matrix for numeric columns
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-        corr_matrix = self.df[numeric_cols].corr()
+        corr_matrix = _corr_matrix(self.data_key, self.df)
         
         fig_heatmap = px.imshow(
             corr_matrix,
@@ -339,6 +483,7 @@ class StreamlitWRICEFDashboard:
         fig_pivot.update_layout(height=400)
         st.plotly_chart(fig_pivot, use_container_width=True)
     
+    @st.fragment
     def generate_insights(self):
         """Generate and display insights"""
         st.header("💡 Key Insights")
@@ -350,26 +495,26 @@ class StreamlitWRICEFDashboard:
         insights.append(f"📊 **Total WRICEF items:** {total_items:,}")
         
         # Most common WRICEF type
-        most_common_wricef = self.df['WRICEF Type'].mode()[0]
-        wricef_count = self.df['WRICEF Type'].value_counts()[most_common_wricef]
+        wricef_counts = _vc(self.data_key, self.df, 'WRICEF Type')
+        most_common_wricef, wricef_count = wricef_counts.index[0], wricef_counts.iloc[0]
         insights.append(f"🏆 **Most common WRICEF type:** {most_common_wricef} ({wricef_count:,} items, {wricef_count/total_items*100:.1f}%)")
         
         # Implementation analysis
-        impl_counts = self.df['Implementation'].value_counts()
+        impl_counts = _vc(self.data_key, self.df, 'Implementation')
         insights.append(f"🚀 **Largest implementation:** {impl_counts.index[0]} ({impl_counts.iloc[0]:,} items, {impl_counts.iloc[0]/total_items*100:.1f}%)")
         
-        # Effort analysis
-        avg_abap_effort = self.df['ABAP Effort Forecast (hrs)'].mean()
-        total_abap_effort = self.df['ABAP Effort Forecast (hrs)'].sum()
+        # Effort analysis (mean and sum in a single aggregation, accumulated in float64)
+        effort_stats = self.df['ABAP Effort Forecast (hrs)'].astype(np.float64).agg(['mean', 'sum'])
+        avg_abap_effort, total_abap_effort = effort_stats['mean'], effort_stats['sum']
         insights.append(f"⚡ **Average ABAP effort forecast:** {avg_abap_effort:.1f} hours")
         insights.append(f"🔥 **Total ABAP effort forecast:** {total_abap_effort:,.1f} hours")
         
         # Complexity analysis
-        complexity_counts = self.df['Complexity'].value_counts()
+        complexity_counts = _vc(self.data_key, self.df, 'Complexity')
         insights.append(f"🎯 **Most common complexity:** {complexity_counts.index[0]} ({complexity_counts.iloc[0]:,} items, {complexity_counts.iloc[0]/total_items*100:.1f}%)")
         
         # Priority analysis
-        priority_counts = self.df['Priority of Delivery'].value_counts()
+        priority_counts = _vc(self.data_key, self.df, 'Priority of Delivery')
         insights.append(f"⭐ **Most common priority:** {priority_counts.index[0]} ({priority_counts.iloc[0]:,} items, {priority_counts.iloc[0]/total_items*100:.1f}%)")
         
         # Effort efficiency
@@ -387,52 +532,50 @@ class StreamlitWRICEFDashboard:
     def create_filters(self):
         """Create interactive filters"""
         st.sidebar.header("🔧 Filters")
+        opts = _filter_options(self.data_key, self.df)
         
         # Implementation filter
-        implementations = ['All'] + list(self.df['Implementation'].unique())
-        selected_impl = st.sidebar.selectbox("Select Implementation", implementations)
+        selected_impl = st.sidebar.selectbox("Select Implementation", opts['Implementation'])
         
         # WRICEF Type filter
-        wricef_types = ['All'] + list(self.df['WRICEF Type'].unique())
-        selected_wricef = st.sidebar.selectbox("Select WRICEF Type", wricef_types)
+        selected_wricef = st.sidebar.selectbox("Select WRICEF Type", opts['WRICEF Type'])
         
         # Complexity filter
-        complexities = ['All'] + list(self.df['Complexity'].unique())
-        selected_complexity = st.sidebar.selectbox("Select Complexity", complexities)
+        selected_complexity = st.sidebar.selectbox("Select Complexity", opts['Complexity'])
         
         # Priority filter
-        priorities = ['All'] + list(self.df['Priority of Delivery'].unique())
-        selected_priority = st.sidebar.selectbox("Select Priority", priorities)
+        selected_priority = st.sidebar.selectbox("Select Priority", opts['Priority of Delivery'])
         
         # Date range filter
         date_range = st.sidebar.date_input(
             "Select Date Range",
-            value=[self.df['FSD Planned Del Date'].min().date(), self.df['FSD Planned Del Date'].max().date()],
-            min_value=self.df['FSD Planned Del Date'].min().date(),
-            max_value=self.df['FSD Planned Del Date'].max().date()
+            value=[opts['date_min'], opts['date_max']],
+            min_value=opts['date_min'],
+            max_value=opts['date_max']
         )
         
-        # Apply filters
-        filtered_df = self.df.copy()
+        # Apply filters as one combined mask so the frame is only indexed once
+        mask = np.ones(len(self.df), dtype=bool)
         
         if selected_impl != 'All':
-            filtered_df = filtered_df[filtered_df['Implementation'] == selected_impl]
+            mask &= np.asarray(self.df['Implementation'] == selected_impl)
         
         if selected_wricef != 'All':
-            filtered_df = filtered_df[filtered_df['WRICEF Type'] == selected_wricef]
+            mask &= np.asarray(self.df['WRICEF Type'] == selected_wricef)
         
         if selected_complexity != 'All':
-            filtered_df = filtered_df[filtered_df['Complexity'] == selected_complexity]
+            mask &= np.asarray(self.df['Complexity'] == selected_complexity)
         
         if selected_priority != 'All':
-            filtered_df = filtered_df[filtered_df['Priority of Delivery'] == selected_priority]
+            mask &= np.asarray(self.df['Priority of Delivery'] == selected_priority)
         
         if len(date_range) == 2:
             start_date, end_date = date_range
-            filtered_df = filtered_df[
-                (filtered_df['FSD Planned Del Date'].dt.date >= start_date) &
-                (filtered_df['FSD Planned Del Date'].dt.date <= end_date)
-            ]
+            mask &= (self._fsd_d >= np.datetime64(start_date)) & (self._fsd_d <= np.datetime64(end_date))
+        
+        filtered_df = self.df[mask]
+        self.data_key = self.data_key + (selected_impl, selected_wricef, selected_complexity,
+                                         selected_priority, tuple(date_range))
         
         st.sidebar.write(f"Filtered records: {len(filtered_df)}")
         
@@ -461,28 +604,20 @@ def main():
         dashboard.df = dashboard.create_filters()
         
         # Navigation
+        pages = {
+            "Data Overview": dashboard.data_overview,
+            "Distribution Analysis": dashboard.create_distribution_charts,
+            "Effort Analysis": dashboard.create_effort_analysis,
+            "Timeline Analysis": dashboard.create_timeline_analysis,
+            "Advanced Analytics": dashboard.create_advanced_visualizations,
+            "Correlation Analysis": dashboard.create_heatmaps,
+            "Key Insights": dashboard.generate_insights,
+        }
         st.sidebar.header("🧭 Navigation")
-        page = st.sidebar.selectbox(
-            "Select Analysis Page",
-            ["Data Overview", "Distribution Analysis", "Effort Analysis", 
-             "Timeline Analysis", "Advanced Analytics", "Correlation Analysis", "Key Insights"]
-        )
+        page = st.sidebar.selectbox("Select Analysis Page", list(pages))
         
-        # Display selected page
-        if page == "Data Overview":
-            dashboard.data_overview()
-        elif page == "Distribution Analysis":
-            dashboard.create_distribution_charts()
-        elif page == "Effort Analysis":
-            dashboard.create_effort_analysis()
-        elif page == "Timeline Analysis":
-            dashboard.create_timeline_analysis()
-        elif page == "Advanced Analytics":
-            dashboard.create_advanced_visualizations()
-        elif page == "Correlation Analysis":
-            dashboard.create_heatmaps()
-        elif page == "Key Insights":
-            dashboard.generate_insights()
+        # Display selected page (only the selected page is rendered)
+        pages[page]()
         
         # Footer
         st.markdown("---")
@@ -1,38 +1,117 @@
 # WRICEF Data Visualizer - Main Script
 # This script processes WRICEF tracker data and creates comprehensive visualizations
 
+import argparse
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime
+import os
+import glob
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings('ignore')
 
+# Upper bound on rows passed to point-level interactive plots
+MAX_PLOT_ROWS = 20000
+
+# Row count above which the static effort scatter is drawn as a hexbin
+HEXBIN_MIN_ROWS = 5000
+
+# Resolution for saved PNGs (screen quality; raise to 300 for print)
+SAVE_DPI = 150
+
 class WRICEFDataVisualizer:
-    def __init__(self, file_path):
-        """Initialize the visualizer with data file"""
+    # Plot style is global matplotlib state, so it only needs to be applied once
+    _style_set = False
+    
+    # Column types applied in prepare_data (not at read time, where mixed
+    # number/text values would make the category conversion raise)
+    DTYPES = {
+        'Implementation': 'category',
+        'WRICEF Type': 'category',
+        'Complexity': 'category',
+        'Priority of Delivery': 'category',
+        'Stage': 'category',
+    }
+    EFFORT_COLS = ['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)',
+                   'PI Effort Forecast (hrs)', 'PI Actual Effort (hrs)']
+    DATE_COLS = ['FSD Planned Del Date', 'Dev Actual Delivery Date']
+    # Only these columns are referenced by the plots and insights
+    USED_COLS = set(DTYPES) | set(EFFORT_COLS) | set(DATE_COLS)
+    
+    def __init__(self, file_path, *, static=True, interactive=True):
+        """Initialize the visualizer with data file and the plot kinds to generate"""
         self.df = None
         self.file_path = file_path
+        self.static = static
+        self.interactive = interactive
+        if not WRICEFDataVisualizer._style_set:
+            plt.style.use('seaborn-v0_8-darkgrid')
+            sns.set_palette("husl")
+            WRICEFDataVisualizer._style_set = True
         self.load_data()
         self.prepare_data()
+        self.save_cache()
     
     def load_data(self):
-        """Load data from Excel file"""
+        """Load data from Excel file, reusing a prepared Parquet copy when the file is unchanged"""
+        # Set when the frame came from Excel and should be cached once prepared
+        self._cache_path = None
         try:
-            self.df = pd.read_excel(self.file_path)
-            print(f"Data loaded successfully. Shape: {self.df.shape}")
+            # Nanosecond mtime plus size, so edits within the same second still miss the cache
+            stat = os.stat(self.file_path)
+            cache_path = f"{self.file_path}.{stat.st_mtime_ns}-{stat.st_size}.parquet"
+            df = None
+            if os.path.exists(cache_path):
+                try:
+                    df = pd.read_parquet(cache_path)
+                    print(f"Data loaded from cache. Shape: {df.shape}")
+                except Exception as e:
+                    print(f"Ignoring unreadable Parquet cache: {e}")
+            if df is None:
+                df = pd.read_excel(self.file_path, usecols=lambda col: col in self.USED_COLS)
+                print(f"Data loaded successfully. Shape: {df.shape}")
+                self._cache_path = cache_path
+            self.df = df
         except Exception as e:
             print(f"Error loading data: {e}")
             # Create sample data if file not found
             self.create_sample_data()
+        
+        # Drop any columns the analysis never reads
+        self.df = self.df.drop(columns=[col for col in self.df.columns if col not in self.USED_COLS])
+    
+    def save_cache(self):
+        """Write the prepared data to the Parquet cache and remove stale copies"""
+        if self._cache_path is None:
+            return
+        # Write to a temporary file first so a partial write never looks like a valid cache
+        tmp_path = self._cache_path + '.tmp'
+        try:
+            self.df.to_parquet(tmp_path)
+            os.replace(tmp_path, self._cache_path)
+        except Exception as e:
+            print(f"Could not write Parquet cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        # Caches for earlier versions of the workbook are never read again
+        for stale_path in glob.glob(glob.escape(self.file_path) + '.*.parquet'):
+            if stale_path != self._cache_path:
+                try:
+                    os.remove(stale_path)
+                except OSError as e:
+                    print(f"Could not remove stale cache {stale_path}: {e}")
     
     def create_sample_data(self):
         """Create sample data for demonstration"""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n_records = 500
         
         implementations = ['Catalyst', 'Goldilocks (ANZ)', 'EWM', 'Supernova']
@@ -42,67 +121,77 @@ class WRICEFDataVisualizer:
         stages = ['06 - Dev Completed', '04 - Dev in progress', '16 - FS Review in Progress', 
                  '13 - Deferred', '15 - No Development Required']
         
+        # Dates are drawn as day offsets from a fixed start date
+        start_date, end_date = np.datetime64('2022-01-01'), np.datetime64('2024-12-31')
+        n_days = (end_date - start_date).astype(int) + 1
+        
         self.df = pd.DataFrame({
-            'Implementation': np.random.choice(implementations, n_records),
-            'WRICEF Type': np.random.choice(wricef_types, n_records),
-            'Complexity': np.random.choice(complexities, n_records),
-            'Priority of Delivery': np.random.choice(priorities, n_records),
-            'Stage': np.random.choice(stages, n_records),
-            'ABAP Effort Forecast (hrs)': np.random.uniform(10, 200, n_records),
-            'ABAP Actual Effort (hrs)': np.random.uniform(10, 200, n_records),
-            'PI Effort Forecast (hrs)': np.random.uniform(5, 100, n_records),
-            'PI Actual Effort (hrs)': np.random.uniform(5, 100, n_records),
-            'FSD Planned Del Date': pd.date_range('2022-01-01', '2024-12-31', n_records),
-            'Dev Actual Delivery Date': pd.date_range('2022-01-01', '2024-12-31', n_records)
+            'Implementation': rng.choice(implementations, n_records),
+            'WRICEF Type': rng.choice(wricef_types, n_records),
+            'Complexity': rng.choice(complexities, n_records),
+            'Priority of Delivery': rng.choice(priorities, n_records),
+            'Stage': rng.choice(stages, n_records),
+            'ABAP Effort Forecast (hrs)': rng.uniform(10, 200, n_records).astype(np.float32),
+            'ABAP Actual Effort (hrs)': rng.uniform(10, 200, n_records).astype(np.float32),
+            'PI Effort Forecast (hrs)': rng.uniform(5, 100, n_records).astype(np.float32),
+            'PI Actual Effort (hrs)': rng.uniform(5, 100, n_records).astype(np.float32),
+            'FSD Planned Del Date': start_date + rng.integers(0, n_days, n_records).astype('timedelta64[D]'),
+            'Dev Actual Delivery Date': start_date + rng.integers(0, n_days, n_records).astype('timedelta64[D]')
         })
         print("Sample data created for demonstration")
     
     def prepare_data(self):
         """Prepare data for analysis"""
-        # Convert date columns
-        date_columns = [col for col in self.df.columns if 'Date' in col]
-        for col in date_columns:
-            if col in self.df.columns:
+        self._vc = {}
+        
+        # Convert date columns that were not already read as datetimes
+        for col in self.DATE_COLS:
+            if col in self.df.columns and not pd.api.types.is_datetime64_any_dtype(self.df[col]):
                 self.df[col] = pd.to_datetime(self.df[col], errors='coerce')
         
         # Fill missing effort values
-        effort_cols = ['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)', 
-                      'PI Effort Forecast (hrs)', 'PI Actual Effort (hrs)']
-        for col in effort_cols:
+        for col in self.EFFORT_COLS:
             if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce').fillna(0)
+                if not pd.api.types.is_numeric_dtype(self.df[col]):
+                    self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+                self.df[col] = self.df[col].fillna(0).astype(np.float32)
+        
+        # Store low-cardinality string columns as categories
+        for col, dtype in self.DTYPES.items():
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype(dtype)
+    
+    def vc(self, col):
+        """Return value counts for a column, computed once per prepared dataset"""
+        if col not in self._vc:
+            self._vc[col] = self.df[col].value_counts()
+        return self._vc[col]
     
     def create_dashboard_plots(self):
         """Create various dashboard plots"""
         plots = {}
         
-        # Set style
-        plt.style.use('seaborn-v0_8-darkgrid')
-        sns.set_palette("husl")
-        
         # 1. WRICEF Type Distribution
         fig1, ax1 = plt.subplots(figsize=(12, 6))
-        wricef_counts = self.df['WRICEF Type'].value_counts()
+        wricef_counts = self.vc('WRICEF Type')
         colors = plt.cm.Set3(np.linspace(0, 1, len(wricef_counts)))
-        bars = ax1.bar(wricef_counts.index, wricef_counts.values, color=colors, edgecolor='black', linewidth=1)
+        bars = ax1.bar(wricef_counts.index.to_numpy(str), wricef_counts.to_numpy(), color=colors, edgecolor='black', linewidth=1)
         ax1.set_title('WRICEF Type Distribution', fontsize=16, fontweight='bold', pad=20)
         ax1.set_xlabel('WRICEF Type', fontsize=12)
         ax1.set_ylabel('Count', fontsize=12)
         ax1.grid(axis='y', alpha=0.3)
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+        ax1.bar_label(bars, fmt='%d', fontsize=10, fontweight='bold')
         
         plt.tight_layout()
         plots['wricef_distribution'] = fig1
         
         # 2. Implementation vs Complexity Heatmap
         fig2, ax2 = plt.subplots(figsize=(12, 8))
-        pivot_data = pd.crosstab(self.df['Implementation'], self.df['Complexity'])
-        sns.heatmap(pivot_data, annot=True, fmt='d', cmap='YlOrRd', ax=ax2, 
+        # Computed once; its transpose feeds the Complexity by Implementation chart below
+        impl_by_complex = self.df.groupby(['Implementation', 'Complexity'], observed=True).size().unstack(fill_value=0)
+        sns.heatmap(impl_by_complex, annot=True, fmt='d', cmap='YlOrRd', ax=ax2, 
                    cbar_kws={'label': 'Count'}, linewidths=0.5)
         ax2.set_title('Implementation vs Complexity Heatmap', fontsize=16, fontweight='bold', pad=20)
         ax2.set_xlabel('Complexity', fontsize=12)
@@ -113,12 +202,27 @@ class WRICEFDataVisualizer:
         # 3. Comprehensive Effort Analysis
         fig3, ((ax3a, ax3b), (ax3c, ax3d)) = plt.subplots(2, 2, figsize=(16, 12))
         
+        # The panels' reductions are independent, so compute them up front in parallel
+        abap_cols = ['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)']
+        has_abap = all(col in self.df.columns for col in abap_cols)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            effort_future = executor.submit(lambda: self.df[abap_cols].dropna()) if has_abap else None
+            priority_future = executor.submit(self.vc, 'Priority of Delivery')
+            stage_future = executor.submit(self.vc, 'Stage')
+        priority_counts = priority_future.result()
+        stage_counts = stage_future.result()
+        
         # ABAP Effort Comparison
-        if 'ABAP Effort Forecast (hrs)' in self.df.columns and 'ABAP Actual Effort (hrs)' in self.df.columns:
-            effort_data = self.df[['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)']].dropna()
-            scatter = ax3a.scatter(effort_data['ABAP Effort Forecast (hrs)'], 
-                        effort_data['ABAP Actual Effort (hrs)'], alpha=0.6, s=50, c='steelblue')
-            max_val = max(effort_data['ABAP Effort Forecast (hrs)'].max(), effort_data['ABAP Actual Effort (hrs)'].max())
+        if has_abap:
+            effort_data = effort_future.result()
+            forecast = effort_data['ABAP Effort Forecast (hrs)'].to_numpy(np.float32)
+            actual = effort_data['ABAP Actual Effort (hrs)'].to_numpy(np.float32)
+            if len(effort_data) > HEXBIN_MIN_ROWS:
+                # Bin large datasets instead of drawing one marker per row
+                ax3a.hexbin(forecast, actual, gridsize=60, cmap='Blues', mincnt=1)
+            else:
+                ax3a.scatter(forecast, actual, alpha=0.6, s=50, c='steelblue')
+            max_val = max(forecast.max(), actual.max()) if len(effort_data) else 0
             ax3a.plot([0, max_val], [0, max_val], 'r--', alpha=0.8, linewidth=2, label='Perfect Estimation')
             ax3a.set_xlabel('Forecast Effort (hrs)', fontsize=12)
             ax3a.set_ylabel('Actual Effort (hrs)', fontsize=12)
@@ -127,25 +231,24 @@ class WRICEFDataVisualizer:
             ax3a.grid(True, alpha=0.3)
         
         # Priority Distribution
-        priority_counts = self.df['Priority of Delivery'].value_counts()
         colors_pie = plt.cm.Pastel1(np.linspace(0, 1, len(priority_counts)))
-        wedges, texts, autotexts = ax3b.pie(priority_counts.values, labels=priority_counts.index, 
+        wedges, texts, autotexts = ax3b.pie(priority_counts.to_numpy(), labels=priority_counts.index.to_numpy(str), 
                                            autopct='%1.1f%%', colors=colors_pie, startangle=90)
         ax3b.set_title('Priority Distribution', fontsize=14, fontweight='bold')
         
         # Stage Progress
-        stage_counts = self.df['Stage'].value_counts()
         colors_bar = plt.cm.viridis(np.linspace(0, 1, len(stage_counts)))
-        bars = ax3c.barh(range(len(stage_counts)), stage_counts.values, color=colors_bar)
+        bars = ax3c.barh(np.arange(len(stage_counts)), stage_counts.to_numpy(), color=colors_bar)
         ax3c.set_yticks(range(len(stage_counts)))
-        ax3c.set_yticklabels([label[:30] + '...' if len(label) > 30 else label for label in stage_counts.index], fontsize=9)
+        stage_labels = stage_counts.index.astype(str)
+        stage_labels = np.where(stage_labels.str.len() > 30, stage_labels.str.slice(0, 30) + '...', stage_labels)
+        ax3c.set_yticklabels(stage_labels, fontsize=9)
         ax3c.set_title('Development Stage Distribution', fontsize=14, fontweight='bold')
         ax3c.set_xlabel('Count', fontsize=12)
         ax3c.grid(axis='x', alpha=0.3)
         
         # Complexity by Implementation
-        complexity_impl = pd.crosstab(self.df['Complexity'], self.df['Implementation'])
-        complexity_impl.plot(kind='bar', stacked=True, ax=ax3d, colormap='tab10')
+        impl_by_complex.T.plot(kind='bar', stacked=True, ax=ax3d, colormap='tab10')
         ax3d.set_title('Complexity by Implementation', fontsize=14, fontweight='bold')
         ax3d.set_xlabel('Complexity', fontsize=12)
         ax3d.set_ylabel('Count', fontsize=12)
@@ -160,8 +263,15 @@ class WRICEFDataVisualizer:
         if 'FSD Planned Del Date' in self.df.columns:
             fig4, (ax4a, ax4b) = plt.subplots(2, 1, figsize=(14, 10))
             
-            # Monthly delivery trend
-            monthly_data = self.df.groupby(self.df['FSD Planned Del Date'].dt.to_period('M')).size()
+            # Month periods are built once from a datetime64[M] view; quarters derive from them
+            month_floor = self.df['FSD Planned Del Date'].to_numpy(dtype='datetime64[M]')
+            per_m = pd.PeriodIndex(month_floor, freq='M')
+            per_q = per_m.asfreq('Q')
+            
+            # Monthly delivery trend (grouped count via integer codes + bincount)
+            month_codes, month_index = pd.factorize(per_m, sort=True)
+            monthly_counts = np.bincount(month_codes[month_codes >= 0], minlength=len(month_index))
+            monthly_data = pd.Series(monthly_counts, index=month_index)
             monthly_data.plot(kind='line', ax=ax4a, marker='o', linewidth=2, markersize=6)
             ax4a.set_title('Monthly Delivery Trend', fontsize=14, fontweight='bold')
             ax4a.set_xlabel('Month', fontsize=12)
@@ -169,7 +279,7 @@ class WRICEFDataVisualizer:
             ax4a.grid(True, alpha=0.3)
             
             # Quarterly implementation breakdown
-            quarterly_impl = self.df.groupby([self.df['FSD Planned Del Date'].dt.to_period('Q'), 'Implementation']).size().unstack(fill_value=0)
+            quarterly_impl = self.df.groupby([per_q, 'Implementation'], observed=True).size().unstack(fill_value=0)
             quarterly_impl.plot(kind='bar', stacked=True, ax=ax4b, colormap='tab10')
             ax4b.set_title('Quarterly Implementation Breakdown', fontsize=14, fontweight='bold')
             ax4b.set_xlabel('Quarter', fontsize=12)
@@ -187,22 +297,26 @@ class WRICEFDataVisualizer:
         """Create interactive Plotly visualizations"""
         interactive_plots = {}
         
+        # Subsample large trackers so point-level plots stay responsive
+        df_plot = self.df if len(self.df) <= MAX_PLOT_ROWS else self.df.sample(MAX_PLOT_ROWS, random_state=0)
+        
         # 1. Interactive Timeline
         if 'FSD Planned Del Date' in self.df.columns:
-            fig_timeline = px.scatter(self.df, 
+            fig_timeline = px.scatter(df_plot, 
                                     x='FSD Planned Del Date', 
                                     y='Implementation',
                                     color='WRICEF Type',
                                     size='ABAP Effort Forecast (hrs)' if 'ABAP Effort Forecast (hrs)' in self.df.columns else None,
                                     hover_data=['Complexity', 'Priority of Delivery', 'Stage'],
                                     title='Interactive Project Timeline',
-                                    template='plotly_white')
+                                    template='plotly_white',
+                                    render_mode='webgl')
             fig_timeline.update_layout(height=600)
             interactive_plots['timeline'] = fig_timeline
         
         # 2. 3D Effort Analysis
         if all(col in self.df.columns for col in ['ABAP Effort Forecast (hrs)', 'ABAP Actual Effort (hrs)', 'PI Effort Forecast (hrs)']):
-            fig_3d = px.scatter_3d(self.df,
+            fig_3d = px.scatter_3d(df_plot,
                                  x='ABAP Effort Forecast (hrs)',
                                  y='ABAP Actual Effort (hrs)',
                                  z='PI Effort Forecast (hrs)',
@@ -210,20 +324,25 @@ class WRICEFDataVisualizer:
                                  symbol='WRICEF Type',
                                  title='3D Effort Analysis',
                                  template='plotly_white')
+            fig_3d.update_traces(marker=dict(size=4))
             fig_3d.update_layout(height=700)
             interactive_plots['effort_3d'] = fig_3d
         
-        # 3. Sunburst Chart
-        fig_sunburst = px.sunburst(self.df, 
+        # 3. Sunburst Chart (pre-aggregated so the figure holds one row per path)
+        hierarchy_counts = self.df.groupby(['Implementation', 'WRICEF Type', 'Complexity'], observed=True).size().reset_index(name='count')
+        fig_sunburst = px.sunburst(hierarchy_counts, 
                                  path=['Implementation', 'WRICEF Type', 'Complexity'],
+                                 values='count',
                                  title='Hierarchical View: Implementation → WRICEF Type → Complexity',
                                  template='plotly_white')
         fig_sunburst.update_layout(height=600)
         interactive_plots['sunburst'] = fig_sunburst
         
         # 4. Interactive Treemap
-        fig_treemap = px.treemap(self.df,
+        type_counts = self.df.groupby(['Implementation', 'WRICEF Type'], observed=True).size().reset_index(name='count')
+        fig_treemap = px.treemap(type_counts,
                                path=['Implementation', 'WRICEF Type'],
+                               values='count',
                                title='WRICEF Distribution Treemap',
                                template='plotly_white')
         fig_treemap.update_layout(height=600)
@@ -240,46 +359,82 @@ class WRICEFDataVisualizer:
         insights.append(f"Total WRICEF items: {total_items}")
         
         # Most common WRICEF type
-        most_common_wricef = self.df['WRICEF Type'].mode()[0]
-        wricef_count = self.df['WRICEF Type'].value_counts()[most_common_wricef]
+        wricef_counts = self.vc('WRICEF Type')
+        most_common_wricef, wricef_count = wricef_counts.index[0], wricef_counts.iloc[0]
         insights.append(f"Most common WRICEF type: {most_common_wricef} ({wricef_count} items, {wricef_count/total_items*100:.1f}%)")
         
         # Implementation analysis
-        impl_counts = self.df['Implementation'].value_counts()
+        impl_counts = self.vc('Implementation')
         insights.append(f"Largest implementation: {impl_counts.index[0]} ({impl_counts.iloc[0]} items, {impl_counts.iloc[0]/total_items*100:.1f}%)")
         
         # Effort analysis
         if 'ABAP Effort Forecast (hrs)' in self.df.columns:
-            avg_abap_effort = self.df['ABAP Effort Forecast (hrs)'].mean()
-            total_abap_effort = self.df['ABAP Effort Forecast (hrs)'].sum()
+            # One pass over the raw float32 array; the mean is derived from the sum
+            abap_effort = self.df['ABAP Effort Forecast (hrs)'].to_numpy()
+            total_abap_effort = abap_effort.sum(dtype=np.float64)
+            avg_abap_effort = total_abap_effort / len(abap_effort) if len(abap_effort) else float('nan')
             insights.append(f"Average ABAP effort forecast: {avg_abap_effort:.1f} hours")
             insights.append(f"Total ABAP effort forecast: {total_abap_effort:.1f} hours")
         
         # Complexity analysis
-        complexity_counts = self.df['Complexity'].value_counts()
+        complexity_counts = self.vc('Complexity')
         insights.append(f"Most common complexity: {complexity_counts.index[0]} ({complexity_counts.iloc[0]} items, {complexity_counts.iloc[0]/total_items*100:.1f}%)")
         
         # Priority analysis
-        priority_counts = self.df['Priority of Delivery'].value_counts()
+        priority_counts = self.vc('Priority of Delivery')
         insights.append(f"Most common priority: {priority_counts.index[0]} ({priority_counts.iloc[0]} items, {priority_counts.iloc[0]/total_items*100:.1f}%)")
         
         # Stage analysis
-        stage_counts = self.df['Stage'].value_counts()
+        stage_counts = self.vc('Stage')
         insights.append(f"Most common stage: {stage_counts.index[0]} ({stage_counts.iloc[0]} items, {stage_counts.iloc[0]/total_items*100:.1f}%)")
         
         return insights
 
-def main():
+def save_static_plot(name, fig):
+    """Save a matplotlib figure as PNG and return the filename"""
+    filename = f'{name}.png'
+    fig.savefig(filename, dpi=SAVE_DPI, bbox_inches='tight', facecolor='white')
+    return filename
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate WRICEF tracker visualizations")
+    parser.add_argument('--no-static', action='store_true',
+                        help="skip the matplotlib PNG plots")
+    parser.add_argument('--no-interactive', action='store_true',
+                        help="skip the Plotly HTML plots")
+    parser.add_argument('--no-show', action='store_true',
+                        help="don't open plot windows (uses the non-GUI Agg backend)")
+    return parser.parse_args(argv)
+
+def save_interactive_plot(name, fig):
+    """Save a Plotly figure as HTML (plotly.js loaded from CDN) and return the filename"""
+    filename = f'{name}_interactive.html'
+    fig.write_html(filename, include_plotlyjs='cdn', include_mathjax=False, full_html=True)
+    return filename
+
+def main(argv=None):
     """Main function to run the visualizer"""
-    visualizer = WRICEFDataVisualizer('WRICEF-Tracker-dump.xlsx')
+    args = parse_args(argv)
+    if args.no_show:
+        # Headless run: avoid initializing a GUI backend
+        matplotlib.use('Agg')
+    
+    visualizer = WRICEFDataVisualizer('WRICEF-Tracker-dump.xlsx',
+                                      static=not args.no_static,
+                                      interactive=not args.no_interactive)
     
     # Generate static plots
-    print("Generating static plots...")
-    static_plots = visualizer.create_dashboard_plots()
+    static_plots = {}
+    if visualizer.static:
+        print("Generating static plots...")
+        static_plots = visualizer.create_dashboard_plots()
     
     # Generate interactive plots
-    print("Generating interactive plots...")
-    interactive_plots = visualizer.create_interactive_plots()
+    interactive_plots = {}
+    if visualizer.interactive:
+        print("Generating interactive plots...")
+        interactive_plots = visualizer.create_interactive_plots()
     
     # Generate insights
     insights = visualizer.generate_insights()
@@ -292,21 +447,19 @@ def main():
     
     # Save plots
     print("\nSaving plots...")
-    for name, fig in static_plots.items():
-        filename = f'{name}.png'
-        fig.savefig(filename, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✅ Saved {filename}")
-    
-    # Save interactive plots as HTML
-    for name, fig in interactive_plots.items():
-        filename = f'{name}_interactive.html'
-        fig.write_html(filename)
-        print(f"✅ Saved {filename}")
+    # PNG encoding releases the GIL, so figures are written in parallel
+    with ThreadPoolExecutor() as executor:
+        saved_png = executor.map(save_static_plot, static_plots.keys(), static_plots.values())
+        # Save interactive plots as HTML
+        saved_html = executor.map(save_interactive_plot, interactive_plots.keys(), interactive_plots.values())
+        for filename in [*saved_png, *saved_html]:
+            print(f"✅ Saved {filename}")
     
     print(f"\n✅ Analysis complete! Generated {len(static_plots)} static plots and {len(interactive_plots)} interactive plots.")
     
     # Show plots
-    plt.show()
+    if static_plots and not args.no_show:
+        plt.show()
     
     return visualizer, static_plots, interactive_plots, insights
 